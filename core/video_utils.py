@@ -1,7 +1,10 @@
 """Video generation utilities - Generic framework code (DO NOT MODIFY)."""
 
+import itertools
+import shutil
+import subprocess
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterable, List, Tuple, Optional, Union
 from PIL import Image
 
 # Check if cv2 is available
@@ -53,6 +56,11 @@ class VideoGenerator:
         """Check if video generation is available."""
         return CV2_AVAILABLE
     
+    @staticmethod
+    def is_ffmpeg_available() -> bool:
+        """Check if an ffmpeg executable is on PATH for raw-pipe encoding."""
+        return shutil.which("ffmpeg") is not None
+    
     def create_video_from_frames(
         self,
         frames: List[Image.Image],
@@ -73,9 +81,37 @@ class VideoGenerator:
         if not frames:
             raise ValueError("No frames provided")
         
+        return self.create_video_from_frame_iter(frames, output_path, size)
+    
+    def create_video_from_frame_iter(
+        self,
+        frames: Iterable[Union[Image.Image, "np.ndarray"]],
+        output_path: Path,
+        size: Optional[Tuple[int, int]] = None
+    ) -> Path:
+        """
+        Create video from a stream of frames.
+        
+        Frames are encoded as they are produced, so only one frame needs to
+        be held in memory at a time. Frames may be PIL Images or (H, W, 3)
+        uint8 RGB arrays; arrays are written without converting through PIL.
+        
+        Args:
+            frames: Iterable (e.g. generator) of PIL Images or RGB arrays
+            output_path: Path to save video (extension will be corrected)
+            size: Optional (width, height) tuple. If None, uses first frame size
+            
+        Returns:
+            Path to created video file
+        """
+        frames = iter(frames)
+        first_frame = next(frames, None)
+        if first_frame is None:
+            raise ValueError("No frames provided")
+        
         # Get video size
         if size is None:
-            size = frames[0].size
+            size = self._frame_size(first_frame)
         
         width, height = size
         
@@ -94,22 +130,128 @@ class VideoGenerator:
             (width, height)
         )
         
-        # Write frames
-        for frame in frames:
-            # Ensure RGB and correct size
-            if frame.size != size:
-                frame = frame.resize(size, Image.Resampling.LANCZOS)
-            
-            # Convert PIL Image to OpenCV format (BGR)
-            frame_rgb = frame.convert('RGB')
-            frame_array = np.array(frame_rgb)
-            frame_bgr = cv2.cvtColor(frame_array, cv2.COLOR_RGB2BGR)
+        # Write frames; they may be rendered lazily inside this loop, so a
+        # failure must not leave the writer open or a truncated video behind
+        try:
+            try:
+                for frame in itertools.chain([first_frame], frames):
+                    frame_array = self._frame_to_rgb_array(frame, size)
+                    
+                    # Convert to OpenCV format (BGR)
+                    frame_bgr = cv2.cvtColor(frame_array, cv2.COLOR_RGB2BGR)
+                    
+                    writer.write(frame_bgr)
+            finally:
+                writer.release()
+        except BaseException:
+            output_path.unlink(missing_ok=True)
+            raise
+        
+        return output_path
+    
+    def create_video_from_raw_iter(
+        self,
+        frames: Iterable[Union[Image.Image, "np.ndarray"]],
+        output_path: Path,
+        size: Optional[Tuple[int, int]] = None,
+        fps: Optional[int] = None
+    ) -> Path:
+        """
+        Create an H.264 video by piping raw RGB24 frames into ffmpeg.
+        
+        A single ffmpeg process is started and each frame's pixels are written
+        straight to its stdin, with no per-frame image encoding or color
+        conversion in Python. Frames may be PIL Images or (H, W, 3) uint8 RGB
+        arrays and are consumed lazily, so a generator keeps memory flat.
+        
+        Args:
+            frames: Iterable (e.g. generator) of PIL Images or RGB arrays
+            output_path: Path to save video (extension will be corrected)
+            size: Optional (width, height) tuple. If None, uses first frame size
+            fps: Optional frame rate. If None, uses the generator's fps
             
-            writer.write(frame_bgr)
+        Returns:
+            Path to created video file
+        """
+        frames = iter(frames)
+        first_frame = next(frames, None)
+        if first_frame is None:
+            raise ValueError("No frames provided")
+        
+        if size is None:
+            size = self._frame_size(first_frame)
+        
+        width, height = size
+        
+        # Ensure correct extension
+        output_path = Path(output_path)
+        output_path = output_path.with_suffix(self.extension)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # yuv420p needs even dimensions, so odd sizes are padded by one pixel
+        command = [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgb24",
+            "-s", f"{width}x{height}", "-r", str(fps or self.fps),
+            "-i", "-",
+            "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+            "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p",
+            str(output_path),
+        ]
+        proc = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        
+        try:
+            for frame in itertools.chain([first_frame], frames):
+                frame_array = self._frame_to_rgb_array(frame, size)
+                proc.stdin.write(np.ascontiguousarray(frame_array).data)
+        except BrokenPipeError:
+            # ffmpeg exited early; its stderr below says why
+            pass
+        except BaseException:
+            proc.kill()
+            proc.wait()
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            proc.stderr.close()
+            output_path.unlink(missing_ok=True)
+            raise
+        
+        _, stderr = proc.communicate()
+        if proc.returncode != 0:
+            message = stderr.decode(errors="replace").strip()
+            raise RuntimeError(f"ffmpeg failed to encode {output_path}: {message}")
         
-        writer.release()
         return output_path
     
+    @staticmethod
+    def _frame_to_rgb_array(
+        frame: Union[Image.Image, "np.ndarray"],
+        size: Tuple[int, int]
+    ) -> "np.ndarray":
+        """Get an (H, W, 3) uint8 RGB array of a frame, resized to size if needed."""
+        if isinstance(frame, np.ndarray):
+            # Already RGB pixels, only resize if needed
+            if VideoGenerator._frame_size(frame) == size:
+                return frame
+            frame = Image.fromarray(frame)
+        
+        # Ensure RGB and correct size
+        if frame.size != size:
+            frame = frame.resize(size, Image.Resampling.LANCZOS)
+        return np.asarray(frame.convert('RGB'))
+    
+    @staticmethod
+    def _frame_size(frame: Union[Image.Image, "np.ndarray"]) -> Tuple[int, int]:
+        """Get (width, height) of a PIL Image or (H, W, 3) array frame."""
+        if isinstance(frame, Image.Image):
+            return frame.size
+        height, width = frame.shape[:2]
+        return width, height
+    
     def create_crossfade_video(
         self,
         start_image: Image.Image,
@@ -31,6 +31,7 @@ def main():
 Examples:
     python3 examples/generate.py --num-samples 10
     python3 examples/generate.py --num-samples 100 --output data/output --seed 42
+    python3 examples/generate.py --num-samples 100 --workers 8
         """
     )
     parser.add_argument(
@@ -56,6 +57,12 @@ Examples:
         action="store_true",
         help="Disable video generation"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for rendering (default: 1)"
+    )
     
     args = parser.parse_args()
     
@@ -75,7 +82,11 @@ Examples:
     
     # Generate tasks
     generator = TaskGenerator(config)
-    tasks = generator.generate_dataset()
+    if args.workers > 1:
+        task_ids = [f"{config.domain}_{i:04d}" for i in range(config.num_samples)]
+        tasks = generator.generate_batch(task_ids, workers=args.workers)
+    else:
+        tasks = generator.generate_dataset()
     
     # Write to disk
     writer = OutputWriter(Path(args.output))
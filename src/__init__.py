@@ -7,6 +7,7 @@ This module contains the shape sorter task generator that creates
 Key files:
     - config.py   : Shape sorter configuration (TaskConfig)
     - generator.py: Shape sorter generation logic (TaskGenerator)
+    - animation.py: Ground-truth video frames (ShapeSorterAnimator)
     - prompts.py  : Shape sorter prompt templates (get_prompt)
 """
 
@@ -0,0 +1,229 @@
+"""
+Shape sorter ground-truth animation.
+
+Streams the frames of the solution video, where cards slide one at a time
+from their start positions into the matching outline slots. Only imported
+when video generation is enabled.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from .generator import Point, ShapeSorterRenderer, ShapeSpec
+
+
+class ShapeSorterAnimator:
+    """Renders ground-truth animation frames on top of a ShapeSorterRenderer."""
+    
+    def __init__(self, renderer: ShapeSorterRenderer, render_threads: int = 1):
+        self.renderer = renderer
+        self.canvas = renderer.canvas
+        self.render_threads = render_threads
+    
+    def create_frames(
+        self,
+        specs: Sequence[ShapeSpec],
+        hold_frames: int = 5,
+        transition_frames: int = 25,
+        first_frame: Optional[Image.Image] = None,
+        final_frame: Optional[Image.Image] = None
+    ) -> Iterator[np.ndarray]:
+        """
+        Create animation frames where cards slide smoothly from start to target.
+        
+        Cards move one at a time, sliding smoothly without teleportation.
+        Frames are yielded one by one as (H, W, 3) uint8 RGB arrays so they
+        can be streamed to the encoder without a PIL round trip.
+        
+        first_frame and final_frame may be passed when the caller already
+        rendered them, to avoid rendering the static states twice.
+        """
+        original_specs = list(specs)  # Keep original specs for reference
+        
+        # Render initial state
+        if first_frame is None:
+            first_frame = self.renderer.render_start(specs)
+        
+        # Hold initial position; the encoder only reads frames, so the same
+        # array is repeated instead of copied
+        first_np = np.asarray(first_frame)
+        for _ in range(hold_frames):
+            yield first_np
+        
+        # Background, divider and outlines never change during the animation
+        board = self.renderer.render_board(original_specs)
+        board_np = np.asarray(board)
+        
+        # Static canvas for the current transition: every card except the
+        # moving one, with already moved cards at target and the others at
+        # start. It is updated incrementally from the first frame.
+        static_np = first_np.copy()
+        
+        # One thread pool serves every card transition when threading is on
+        executor = (
+            ThreadPoolExecutor(max_workers=self.render_threads)
+            if self.render_threads > 1 else None
+        )
+        
+        try:
+            # Animate each card moving one at a time
+            for card_idx, original_spec in enumerate(original_specs):
+                # Only two regions change between transitions: the previous card
+                # appears at its target and this card leaves its start position
+                placements = [
+                    (spec, spec.target if idx < card_idx else spec.start)
+                    for idx, spec in enumerate(original_specs)
+                    if idx != card_idx
+                ]
+                if card_idx > 0:
+                    prev_spec = original_specs[card_idx - 1]
+                    self._repaint_box(
+                        static_np, board_np,
+                        self._card_box(prev_spec.target, prev_spec), placements
+                    )
+                self._repaint_box(
+                    static_np, board_np,
+                    self._card_box(original_spec.start, original_spec), placements
+                )
+                
+                # Positions of the moving card for each transition frame; a single
+                # frame transition jumps straight to the target
+                if transition_frames > 1:
+                    xs = np.linspace(original_spec.start[0], original_spec.target[0], transition_frames)
+                    ys = np.linspace(original_spec.start[1], original_spec.target[1], transition_frames)
+                else:
+                    xs = np.array([original_spec.target[0]])
+                    ys = np.array([original_spec.target[1]])
+                positions: List[Point] = list(zip(xs.tolist(), ys.tolist()))
+                
+                if executor is not None:
+                    yield from self._render_frames_threaded(
+                        executor, Image.fromarray(static_np), original_spec, positions
+                    )
+                    continue
+                
+                # The working frame is a uint8 array reused for the whole
+                # transition; only the region around the moving card is restored
+                # from the static canvas and redrawn between frames. It stays RGB
+                # rather than paletted: an index buffer is 3x cheaper to copy, but
+                # expanding it back to RGB for the encoder costs about 10x more
+                # than the full RGB copy it saves.
+                working_np = static_np.copy()
+                prev_box: Optional[Tuple[int, int, int, int]] = None
+                
+                # For each card, create transition frames
+                for current_pos in positions:
+                    if prev_box is not None:
+                        x0, y0, x1, y1 = prev_box
+                        working_np[y0:y1, x0:x1] = static_np[y0:y1, x0:x1]
+                    
+                    # Only the moving card is blitted, from its cached mask
+                    self._blit_card(working_np, original_spec, current_pos)
+                    prev_box = self._card_box(current_pos, original_spec)
+                    yield working_np.copy()
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        
+        # Render final state
+        if final_frame is None:
+            final_frame = self.renderer.render_end(specs)
+        
+        # Hold final position
+        final_np = np.asarray(final_frame)
+        for _ in range(hold_frames):
+            yield final_np
+    
+    def _card_box(self, center: Point, spec: ShapeSpec) -> Tuple[int, int, int, int]:
+        """Canvas-clipped (x0, y0, x1, y1) pixel box covering a card at center."""
+        w, h = self.canvas
+        x0, y0, sprite = self.renderer._card_sprite(spec, center)
+        return (max(x0, 0), max(y0, 0),
+                min(x0 + sprite.mask.width, w), min(y0 + sprite.mask.height, h))
+    
+    def _blit_card(
+        self,
+        canvas_np: np.ndarray,
+        spec: ShapeSpec,
+        center: Point,
+        clip_box: Optional[Tuple[int, int, int, int]] = None
+    ) -> None:
+        """Blit a filled card's cached mask into canvas_np, optionally clipped."""
+        sx, sy, sprite = self.renderer._card_sprite(spec, center)
+        x0, y0, x1, y1 = self._card_box(center, spec)
+        if sprite.solid_rect is not None:
+            # Solid rectangles (squares) are a plain slice fill, no mask needed
+            rx0, ry0, rx1, ry1 = sprite.solid_rect
+            x0, y0 = max(x0, sx + rx0), max(y0, sy + ry0)
+            x1, y1 = min(x1, sx + rx1), min(y1, sy + ry1)
+        if clip_box is not None:
+            x0, y0 = max(x0, clip_box[0]), max(y0, clip_box[1])
+            x1, y1 = min(x1, clip_box[2]), min(y1, clip_box[3])
+        if x0 >= x1 or y0 >= y1:
+            return
+        
+        color = np.asarray(spec.color_rgb, dtype=np.uint8)
+        if sprite.solid_rect is not None:
+            canvas_np[y0:y1, x0:x1] = color
+        else:
+            np.copyto(
+                canvas_np[y0:y1, x0:x1],
+                color,
+                where=sprite.mask_np[y0 - sy:y1 - sy, x0 - sx:x1 - sx, None],
+            )
+    
+    def _repaint_box(
+        self,
+        canvas_np: np.ndarray,
+        board_np: np.ndarray,
+        box: Tuple[int, int, int, int],
+        placements: Sequence[Tuple[ShapeSpec, Point]]
+    ) -> None:
+        """Restore box from the empty board and redraw the cards overlapping it."""
+        x0, y0, x1, y1 = box
+        canvas_np[y0:y1, x0:x1] = board_np[y0:y1, x0:x1]
+        for spec, center in placements:
+            self._blit_card(canvas_np, spec, center, clip_box=box)
+    
+    def _render_frames_threaded(
+        self,
+        executor: ThreadPoolExecutor,
+        base_with_moved: Image.Image,
+        moving_spec: ShapeSpec,
+        positions: Sequence[Point]
+    ) -> Iterator[np.ndarray]:
+        """
+        Render one card's transition frames on the given thread pool, in order.
+        
+        Each frame is an independent copy of the static board, so frames can
+        be rasterised concurrently; Pillow releases the GIL inside its C core.
+        At most two frames per thread are in flight to keep memory bounded.
+        """
+        def render(current_pos: Point) -> np.ndarray:
+            return np.asarray(
+                self._render_animation_frame(base_with_moved, moving_spec, current_pos)
+            )
+        
+        max_pending = 2 * self.render_threads
+        pending: Deque[Future] = deque()
+        for current_pos in positions:
+            pending.append(executor.submit(render, current_pos))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    
+    def _render_animation_frame(
+        self,
+        base_with_moved: Image.Image,
+        moving_spec: ShapeSpec,
+        current_pos: Point
+    ) -> Image.Image:
+        """Render a standalone animation frame on top of the cached static board."""
+        img = base_with_moved.copy()
+        self.renderer._paste_card(img, moving_spec, current_pos)
+        return img
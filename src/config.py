@@ -7,6 +7,8 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+from typing import Literal
+
 from pydantic import Field
 from core import GenerationConfig
 
@@ -52,6 +54,17 @@ class TaskConfig(GenerationConfig):
         description="Maximum video duration in seconds"
     )
     
+    video_encoder: Literal["opencv", "ffmpeg"] = Field(
+        default="opencv",
+        description='Video encoder: "opencv" (mp4v) or "ffmpeg" (H.264 via raw RGB pipe, needs ffmpeg on PATH). '
+                    'Both need opencv-python installed; without ffmpeg, falls back to "opencv"'
+    )
+    
+    render_threads: int = Field(
+        default=1,
+        description="Threads used to rasterise animation frames (1 = sequential)"
+    )
+    
     # ══════════════════════════════════════════════════════════════════════════
     #  TASK-SPECIFIC SETTINGS
     # ══════════════════════════════════════════════════════════════════════════
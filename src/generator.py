@@ -8,12 +8,15 @@
 """
 
 import math
+import os
 import random
 import tempfile
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 from core import BaseGenerator, TaskPair, ImageRenderer
@@ -36,6 +39,56 @@ COLORS = [
 
 SHAPES = ["circle", "square", "triangle", "star", "hexagon", "diamond"]
 
+# Columns and jitter per (layout variant, side)
+_LAYOUT_COLUMNS: Dict[Tuple[str, str], int] = {
+    ("line", "cards"): 1,
+    ("line", "slots"): 1,
+    ("staggered", "cards"): 2,
+    ("staggered", "slots"): 1,
+    ("grid", "cards"): 2,
+    ("grid", "slots"): 2,
+    ("scatter", "cards"): 2,
+    ("scatter", "slots"): 2,
+}
+
+_LAYOUT_JITTER: Dict[Tuple[str, str], float] = {
+    ("line", "cards"): 0.0,
+    ("line", "slots"): 0.0,
+    ("staggered", "cards"): 0.015,
+    ("staggered", "slots"): 0.0,
+    ("grid", "cards"): 0.01,
+    ("grid", "slots"): 0.01,
+    ("scatter", "cards"): 0.03,
+    ("scatter", "slots"): 0.015,
+}
+
+# Vertex angles and radii for the regular polygon shapes (unit size)
+_HEXAGON_ANGLES = np.pi / 6 + np.arange(6) * np.pi / 3
+_STAR_ANGLES = np.pi / 2 + np.arange(10) * np.pi / 5
+_STAR_R = np.where(np.arange(10) % 2 == 0, 0.5, 0.225)
+
+
+def _unit_polygon(radii: np.ndarray, angles: np.ndarray) -> List[Point]:
+    """Vertices of a polygon centered on the origin, from polar coordinates."""
+    points = np.stack([radii * np.cos(angles), radii * np.sin(angles)], axis=1)
+    return [tuple(point) for point in points.tolist()]
+
+
+# Polygon vertices for a shape of size 1 centered on the origin; scaled and
+# translated per draw so the trig is only evaluated once at import time
+_UNIT_POLYGONS: Dict[str, List[Point]] = {
+    "triangle": [(0.0, -0.5), (-0.5, 0.5), (0.5, 0.5)],
+    "diamond": [(0.0, -0.5), (0.5, 0.0), (0.0, 0.5), (-0.5, 0.0)],
+    "hexagon": _unit_polygon(np.full(6, 0.5), _HEXAGON_ANGLES),
+    "star": _unit_polygon(_STAR_R, _STAR_ANGLES),
+}
+
+# Shapes drawn from their bounding box, mapped to the ImageDraw primitive
+_BOX_PRIMITIVES: Dict[str, str] = {
+    "circle": "ellipse",
+    "square": "rectangle",
+}
+
 
 @dataclass
 class ShapeSpec:
@@ -46,11 +99,28 @@ class ShapeSpec:
     start: Point
     target: Point
     size: float
+    # Derived from size once, so drawing code avoids re-converting it per call
+    half: float = field(init=False, repr=False, compare=False)
+    int_size: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.half = self.size * 0.5
+        self.int_size = int(self.size)
 
     def label(self) -> str:
         return f"{self.color_name} {self.shape}"
 
 
+@dataclass
+class CardSprite:
+    """Pre-rasterised fill mask for a card shape at one size."""
+    mask: Image.Image
+    mask_np: np.ndarray
+    # (x0, y0, x1, y1) within the mask when the filled pixels form a solid
+    # rectangle (squares), so they can be filled without consulting the mask
+    solid_rect: Optional[Tuple[int, int, int, int]] = None
+
+
 class ShapeSorterRenderer:
     """Renders shape sorter puzzles using PIL."""
     
@@ -59,23 +129,36 @@ class ShapeSorterRenderer:
         self.bg_color = (248, 250, 252)  # #f8fafc
         self.divider_color = (148, 163, 184)  # #94a3b8
         self.outline_color = (100, 116, 139)  # #64748b
+        # Blend divider color with background for semi-transparent effect
+        self.divider_rgb = tuple(
+            int(self.bg_color[i] * 0.65 + self.divider_color[i] * 0.35)
+            for i in range(3)
+        )
+        # Filled-card masks keyed by (shape, size), rasterised once and reused
+        self._sprite_cache: Dict[Tuple[str, float], CardSprite] = {}
     
-    def render_start(self, specs: Sequence[ShapeSpec]) -> Image.Image:
-        """Render initial state: cards on left, outlines on right."""
+    def render_board(self, specs: Sequence[ShapeSpec]) -> Image.Image:
+        """Render the static board: background, divider and outline slots."""
         img = Image.new('RGB', self.canvas, self.bg_color)
         draw = ImageDraw.Draw(img)
         
         self._draw_layout(draw)
         
-        # Draw outlines first (so cards appear on top)
         for spec in specs:
             self._draw_shape(draw, spec.target, spec.size, spec.shape, 
-                           self.outline_color, filled=False, linewidth=3)
+                           self.outline_color, filled=False, linewidth=3,
+                           half=spec.half)
+        
+        return img
+    
+    def render_start(self, specs: Sequence[ShapeSpec]) -> Image.Image:
+        """Render initial state: cards on left, outlines on right."""
+        # Outlines are drawn first (so cards appear on top)
+        img = self.render_board(specs)
         
         # Draw filled cards
         for spec in specs:
-            self._draw_shape(draw, spec.start, spec.size, spec.shape, 
-                           spec.color_rgb, filled=True)
+            self._paste_card(img, spec, spec.start)
         
         return img
     
@@ -88,26 +171,57 @@ class ShapeSorterRenderer:
         
         # Draw filled cards in target positions
         for spec in specs:
-            self._draw_shape(draw, spec.target, spec.size, spec.shape, 
-                           spec.color_rgb, filled=True)
+            self._paste_card(img, spec, spec.target)
         
         return img
     
+    def _card_sprite(self, spec: ShapeSpec, center: Point) -> Tuple[int, int, CardSprite]:
+        """
+        Get the cached sprite for a card and where to place it.
+        
+        Returns the top-left canvas position for a card centered at center
+        (snapped to whole pixels) and its sprite. The mask is rasterised once
+        per (shape, size).
+        """
+        key = (spec.shape, spec.size)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            sprite = self._build_sprite(spec)
+            self._sprite_cache[key] = sprite
+        extent = sprite.mask.width // 2
+        return round(center[0]) - extent, round(center[1]) - extent, sprite
+    
+    def _build_sprite(self, spec: ShapeSpec) -> CardSprite:
+        """Rasterise a card's fill mask, detecting masks that are solid rectangles."""
+        extent = spec.int_size // 2 + 2
+        mask = Image.new('L', (2 * extent, 2 * extent), 0)
+        self._draw_shape(ImageDraw.Draw(mask), (extent, extent), spec.size,
+                         spec.shape, 255, filled=True, half=spec.half)
+        mask_np = np.asarray(mask) > 0
+        
+        solid_rect = None
+        rows, cols = np.nonzero(mask_np)
+        if rows.size:
+            x0, y0, x1, y1 = cols.min(), rows.min(), cols.max() + 1, rows.max() + 1
+            if mask_np[y0:y1, x0:x1].all():
+                solid_rect = (int(x0), int(y0), int(x1), int(y1))
+        return CardSprite(mask=mask, mask_np=mask_np, solid_rect=solid_rect)
+    
+    def _paste_card(self, img: Image.Image, spec: ShapeSpec, center: Point) -> None:
+        """Blit a filled card onto img using its cached mask."""
+        x0, y0, sprite = self._card_sprite(spec, center)
+        img.paste(spec.color_rgb, (x0, y0), sprite.mask)
+    
     def _draw_layout(self, draw: ImageDraw.Draw) -> None:
         """Draw the board layout with divider."""
         w, h = self.canvas
         # Draw divider line (semi-transparent effect by using lighter color)
         divider_x = w * 0.5
         divider_width = 8
-        # Blend divider color with background for semi-transparent effect
-        divider_rgb = tuple(
-            int(self.bg_color[i] * 0.65 + self.divider_color[i] * 0.35)
-            for i in range(3)
-        )
         draw.rectangle(
             [(divider_x - divider_width // 2, 40), 
              (divider_x + divider_width // 2, h - 40)],
-            fill=divider_rgb
+            fill=self.divider_rgb
         )
     
     def _draw_shape(
@@ -118,75 +232,32 @@ class ShapeSorterRenderer:
         shape: str,
         color: Tuple[int, int, int] | Tuple[int, int, int, int],
         filled: bool,
-        linewidth: float = 2.5,
+        linewidth: int = 2,
+        half: Optional[float] = None,
     ) -> None:
-        """Draw a shape at the given center position."""
-        x, y = center
+        """
+        Draw a shape at the given center position.
         
-        if shape == "circle":
-            bbox = [x - size/2, y - size/2, x + size/2, y + size/2]
-            if filled:
-                draw.ellipse(bbox, fill=color)
-            else:
-                draw.ellipse(bbox, outline=color, width=int(linewidth))
-        
-        elif shape == "square":
-            bbox = [x - size/2, y - size/2, x + size/2, y + size/2]
-            if filled:
-                draw.rectangle(bbox, fill=color)
-            else:
-                draw.rectangle(bbox, outline=color, width=int(linewidth))
-        
-        elif shape == "triangle":
-            points = [
-                (x, y - size/2),
-                (x - size/2, y + size/2),
-                (x + size/2, y + size/2),
-            ]
-            if filled:
-                draw.polygon(points, fill=color)
-            else:
-                draw.polygon(points, outline=color, width=int(linewidth))
-        
-        elif shape == "hexagon":
-            points = []
-            for i in range(6):
-                angle = math.pi / 6 + i * math.pi / 3
-                px = x + (size/2) * math.cos(angle)
-                py = y + (size/2) * math.sin(angle)
-                points.append((px, py))
-            if filled:
-                draw.polygon(points, fill=color)
-            else:
-                draw.polygon(points, outline=color, width=int(linewidth))
-        
-        elif shape == "diamond":
-            points = [
-                (x, y - size/2),
-                (x + size/2, y),
-                (x, y + size/2),
-                (x - size/2, y),
-            ]
-            if filled:
-                draw.polygon(points, fill=color)
-            else:
-                draw.polygon(points, outline=color, width=int(linewidth))
-        
-        elif shape == "star":
-            points = []
-            for i in range(10):
-                angle = math.pi / 2 + i * math.pi / 5
-                r = (size/2) if i % 2 == 0 else (size/2) * 0.45
-                px = x + r * math.cos(angle)
-                py = y + r * math.sin(angle)
-                points.append((px, py))
-            if filled:
-                draw.polygon(points, fill=color)
-            else:
-                draw.polygon(points, outline=color, width=int(linewidth))
+        half may be passed precomputed (ShapeSpec.half) to skip the division.
+        """
+        x, y = center
         
+        template = _UNIT_POLYGONS.get(shape)
+        if template is not None:
+            primitive = draw.polygon
+            geometry = [(x + vx * size, y + vy * size) for vx, vy in template]
+        elif shape in _BOX_PRIMITIVES:
+            primitive = getattr(draw, _BOX_PRIMITIVES[shape])
+            if half is None:
+                half = size * 0.5
+            geometry = [x - half, y - half, x + half, y + half]
         else:
             raise ValueError(f"Unsupported shape type: {shape}")
+        
+        if filled:
+            primitive(geometry, fill=color)
+        else:
+            primitive(geometry, outline=color, width=linewidth)
 
 
 class TaskGenerator(BaseGenerator):
@@ -199,39 +270,104 @@ class TaskGenerator(BaseGenerator):
     def __init__(self, config: TaskConfig):
         super().__init__(config)
         self.renderer = ShapeSorterRenderer(canvas=config.image_size)
-        self._seen_signatures: set[str] = set()
+        # Generator-local RNG: task planning never touches the global random
+        # state, so results are exact per seed regardless of other users of it
+        self._rng = random.Random(config.random_seed)
+        self._seen_signatures: set[Tuple[str, FrozenSet[tuple]]] = set()
         
         # Initialize video generator if enabled
         self.video_generator = None
         if config.generate_videos and VideoGenerator.is_available():
             self.video_generator = VideoGenerator(fps=config.video_fps, output_format="mp4")
+        
+        # Resolve the encoder once; without ffmpeg on PATH fall back to OpenCV
+        self._use_ffmpeg = False
+        if self.video_generator is not None and config.video_encoder == "ffmpeg":
+            self._use_ffmpeg = VideoGenerator.is_ffmpeg_available()
+            if not self._use_ffmpeg:
+                print("⚠️  Warning: ffmpeg not found on PATH. Falling back to OpenCV video encoding.")
     
     def generate_task_pair(self, task_id: str) -> TaskPair:
         """Generate one shape sorter task pair."""
+        task_data = self._plan_task()
+        return self._render_task_pair(task_id, task_data)
+    
+    def generate_batch(
+        self,
+        task_ids: List[str],
+        workers: Optional[int] = None
+    ) -> List[TaskPair]:
+        """
+        Generate task pairs for the given ids across multiple processes.
+        
+        All random decisions (specs, uniqueness check, prompt) are made here in
+        the parent process, in task order, so the output matches sequential
+        generation for the same seed. Only the deterministic rendering and
+        video encoding is distributed to worker processes.
         
+        Args:
+            task_ids: Task ids to generate, in order
+            workers: Number of worker processes (default: os.cpu_count())
+            
+        Returns:
+            Task pairs in the same order as task_ids
+        """
+        plans = [self._plan_task() for _ in task_ids]
+        workers = workers or os.cpu_count() or 1
+        
+        if workers <= 1 or len(task_ids) <= 1:
+            pairs = []
+            for task_id, task_data in zip(task_ids, plans):
+                pairs.append(self._render_task_pair(task_id, task_data))
+                print(f"  Generated: {task_id}")
+            return pairs
+        
+        # Hand workers the already-resolved encoder so none of them re-warns
+        worker_config = self.config.model_copy(
+            update={"video_encoder": "ffmpeg" if self._use_ffmpeg else "opencv"}
+        )
+        
+        pairs = []
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(task_ids)),
+            initializer=_init_worker,
+            initargs=(worker_config,),
+        ) as executor:
+            for pair in executor.map(_render_in_worker, task_ids, plans):
+                pairs.append(pair)
+                print(f"  Generated: {pair.task_id}")
+        return pairs
+    
+    def _plan_task(self) -> dict:
+        """Make all random choices for one task (specs and prompt)."""
         # Generate task data
         difficulty = self.config.difficulty or "medium"
         task_data = self._generate_task_data(difficulty)
         
+        # Generate prompt
+        shape_labels = [spec.label() for spec in task_data["specs"]]
+        task_data["prompt"] = get_prompt(shape_labels, rng=self._rng)
+        
+        return task_data
+    
+    def _render_task_pair(self, task_id: str, task_data: dict) -> TaskPair:
+        """Render images and video for a planned task."""
         # Render images
         first_image = self.renderer.render_start(task_data["specs"])
         final_image = self.renderer.render_end(task_data["specs"])
         
-        # Generate video (optional)
+        # Generate video (optional); without videos the animation module is
+        # never imported and only the two static frames are rendered
         video_path = None
         if self.config.generate_videos and self.video_generator:
             video_path = self._generate_video(
                 first_image, final_image, task_id, task_data
             )
         
-        # Generate prompt
-        shape_labels = [spec.label() for spec in task_data["specs"]]
-        prompt = get_prompt(shape_labels)
-        
         return TaskPair(
             task_id=task_id,
             domain=self.config.domain,
-            prompt=prompt,
+            prompt=task_data["prompt"],
             first_image=first_image,
             final_image=final_image,
             ground_truth_video=video_path
@@ -271,11 +407,11 @@ class TaskGenerator(BaseGenerator):
     def _shape_count_for_difficulty(self, difficulty: str) -> int:
         """Get number of shapes based on difficulty."""
         if difficulty == "easy":
-            return random.randint(2, 3)
+            return self._rng.randint(2, 3)
         elif difficulty == "hard":
-            return random.randint(5, 6)
+            return self._rng.randint(5, 6)
         else:  # medium
-            return random.randint(3, 5)
+            return self._rng.randint(3, 5)
     
     def _create_specs(self, count: int) -> Tuple[List[ShapeSpec], str]:
         """Create shape specifications."""
@@ -322,19 +458,20 @@ class TaskGenerator(BaseGenerator):
     
     def _sample_shapes(self, count: int) -> List[str]:
         """Sample shapes without replacement if possible."""
-        if count <= len(SHAPES):
-            return random.sample(SHAPES, k=count)
-        base = random.sample(SHAPES, k=len(SHAPES))
-        base += random.choices(SHAPES, k=count - len(SHAPES))
-        return base
+        return self._sample_indexed(SHAPES, count)
     
     def _sample_colors(self, count: int) -> List[Tuple[str, Tuple[int, int, int]]]:
         """Sample colors without replacement if possible."""
-        if count <= len(COLORS):
-            return random.sample(COLORS, k=count)
-        colors = random.sample(COLORS, k=len(COLORS))
-        colors += random.choices(COLORS, k=count - len(COLORS))
-        return colors
+        return self._sample_indexed(COLORS, count)
+    
+    def _sample_indexed(self, items: Sequence, count: int) -> list:
+        """Pick count items via one shuffled index permutation, topping up with replacement."""
+        order = list(range(len(items)))
+        self._rng.shuffle(order)
+        picked = [items[i] for i in order[:count]]
+        if count > len(items):
+            picked += self._rng.choices(items, k=count - len(items))
+        return picked
     
     def _choose_layout(self, count: int) -> str:
         """Choose layout variant based on shape count."""
@@ -349,23 +486,11 @@ class TaskGenerator(BaseGenerator):
     
     def _layout_columns(self, layout: str, side: str) -> int:
         """Get number of columns for layout."""
-        base = {
-            "line": 1,
-            "staggered": 2 if side == "cards" else 1,
-            "grid": 2,
-            "scatter": 2,
-        }
-        return base.get(layout, 1)
+        return _LAYOUT_COLUMNS.get((layout, side), 1)
     
     def _layout_jitter(self, layout: str, side: str) -> float:
         """Get jitter amount for layout."""
-        jitter_map = {
-            "line": 0.0,
-            "staggered": 0.015 if side == "cards" else 0.0,
-            "grid": 0.01,
-            "scatter": 0.03 if side == "cards" else 0.015,
-        }
-        return jitter_map.get(layout, 0.0)
+        return _LAYOUT_JITTER.get((layout, side), 0.0)
     
     def _generate_positions(
         self,
@@ -387,8 +512,8 @@ class TaskGenerator(BaseGenerator):
             y = y_range[0] + (row + 0.5) / rows * (y_range[1] - y_range[0])
             
             if jitter > 0:
-                x += random.uniform(-jitter, jitter) * (x_range[1] - x_range[0])
-                y += random.uniform(-jitter, jitter) * (y_range[1] - y_range[0])
+                x += self._rng.uniform(-jitter, jitter) * (x_range[1] - x_range[0])
+                y += self._rng.uniform(-jitter, jitter) * (y_range[1] - y_range[0])
             
             positions.append((x, y))
         
@@ -398,11 +523,12 @@ class TaskGenerator(BaseGenerator):
         
         return positions, size
     
-    def _build_signature(self, specs: Sequence[ShapeSpec], layout_variant: str) -> str:
-        """Build signature for uniqueness checking."""
-        quantized = []
-        for spec in specs:
-            quantized.append((
+    def _build_signature(
+        self, specs: Sequence[ShapeSpec], layout_variant: str
+    ) -> Tuple[str, FrozenSet[tuple]]:
+        """Build signature for uniqueness checking (order-independent)."""
+        return layout_variant, frozenset(
+            (
                 spec.shape,
                 spec.color_name,
                 round(spec.start[0], 1),
@@ -410,10 +536,8 @@ class TaskGenerator(BaseGenerator):
                 round(spec.target[0], 1),
                 round(spec.target[1], 1),
                 round(spec.size, 1),
-            ))
-        quantized.sort()
-        return f"{layout_variant}|{len(specs)}|" + "|".join(
-            ",".join(map(str, item)) for item in quantized
+            )
+            for spec in specs
         )
     
     @property
@@ -447,101 +571,48 @@ class TaskGenerator(BaseGenerator):
         available_frames = max_frames - 2 * hold_frames
         transition_frames = max(10, int(available_frames / num_cards))
         
-        frames = self._create_animation_frames(
+        # Imported lazily: the animation code is only needed for videos
+        from .animation import ShapeSorterAnimator
+        
+        animator = ShapeSorterAnimator(
+            self.renderer, render_threads=self.config.render_threads
+        )
+        frames = animator.create_frames(
             task_data["specs"],
             hold_frames=hold_frames,
-            transition_frames=transition_frames
+            transition_frames=transition_frames,
+            first_frame=first_image,
+            final_frame=final_image
         )
         
-        result = self.video_generator.create_video_from_frames(
-            frames,
-            video_path
-        )
-        
-        return str(result) if result else None
-    
-    def _create_animation_frames(
-        self,
-        specs: Sequence[ShapeSpec],
-        hold_frames: int = 5,
-        transition_frames: int = 25
-    ) -> List[Image.Image]:
-        """
-        Create animation frames where cards slide smoothly from start to target.
-        
-        Cards move one at a time, sliding smoothly without teleportation.
-        """
-        frames = []
-        original_specs = list(specs)  # Keep original specs for reference
-        
-        # Render initial state
-        first_frame = self.renderer.render_start(specs)
-        
-        # Hold initial position
-        for _ in range(hold_frames):
-            frames.append(first_frame.copy())
-        
-        # Animate each card moving one at a time
-        for card_idx, original_spec in enumerate(original_specs):
-            # For each card, create transition frames
-            for i in range(transition_frames):
-                progress = i / (transition_frames - 1) if transition_frames > 1 else 1.0
-                
-                # Calculate current position for this card
-                current_x = original_spec.start[0] + (original_spec.target[0] - original_spec.start[0]) * progress
-                current_y = original_spec.start[1] + (original_spec.target[1] - original_spec.start[1]) * progress
-                
-                # Render frame: cards that have already moved are at target,
-                # current card is at intermediate position, others are at start
-                frame = self._render_animation_frame(
-                    original_specs, card_idx, (current_x, current_y)
-                )
-                frames.append(frame)
-        
-        # Render final state
-        final_frame = self.renderer.render_end(specs)
-        
-        # Hold final position
-        for _ in range(hold_frames):
-            frames.append(final_frame.copy())
-        
-        return frames
-    
-    def _render_animation_frame(
-        self,
-        original_specs: Sequence[ShapeSpec],
-        moving_card_idx: int,
-        current_pos: Point
-    ) -> Image.Image:
-        """Render a single animation frame."""
-        img = Image.new('RGB', self.canvas, self.renderer.bg_color)
-        draw = ImageDraw.Draw(img)
-        
-        # Draw layout
-        self.renderer._draw_layout(draw)
-        
-        # Draw outlines for all slots
-        for spec in original_specs:
-            self.renderer._draw_shape(
-                draw, spec.target, spec.size, spec.shape,
-                self.renderer.outline_color, filled=False, linewidth=3
+        # Pipe raw RGB frames into ffmpeg (H.264) when requested and available
+        if self._use_ffmpeg:
+            result = self.video_generator.create_video_from_raw_iter(
+                frames,
+                video_path
             )
-        
-        # Draw cards: already moved cards at target, moving card at intermediate, others at start
-        for idx, spec in enumerate(original_specs):
-            if idx < moving_card_idx:
-                # Already moved: draw at target
-                pos = spec.target
-            elif idx == moving_card_idx:
-                # Currently moving: draw at current intermediate position
-                pos = current_pos
-            else:
-                # Not yet moved: draw at start
-                pos = spec.start
-            
-            self.renderer._draw_shape(
-                draw, pos, spec.size, spec.shape,
-                spec.color_rgb, filled=True
+        else:
+            result = self.video_generator.create_video_from_frame_iter(
+                frames,
+                video_path
             )
         
-        return img
+        return str(result) if result else None
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  MULTIPROCESSING WORKERS
+# ══════════════════════════════════════════════════════════════════════════════
+
+_worker_generator: Optional[TaskGenerator] = None
+
+
+def _init_worker(config: TaskConfig) -> None:
+    """Create the per-process generator used to render planned tasks."""
+    global _worker_generator
+    _worker_generator = TaskGenerator(config)
+
+
+def _render_in_worker(task_id: str, task_data: dict) -> TaskPair:
+    """Render one planned task inside a worker process."""
+    return _worker_generator._render_task_pair(task_id, task_data)
@@ -8,7 +8,7 @@
 """
 
 import random
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -44,17 +44,21 @@ def format_shape_summary(shape_labels: Iterable[str]) -> str:
     return f"Match the {body}, and finally the {labels[-1]} card."
 
 
-def get_prompt(shape_labels: Iterable[str] = None) -> str:
+def get_prompt(
+    shape_labels: Iterable[str] = None,
+    rng: Optional[random.Random] = None
+) -> str:
     """
     Select a random prompt template and format it with shape summary.
     
     Args:
         shape_labels: List of shape labels (e.g., ["red circle", "blue square"])
+        rng: Random instance to draw from (default: the global random module)
         
     Returns:
         Formatted prompt string
     """
-    template = random.choice(PROMPT_TEMPLATES)
+    template = (rng or random).choice(PROMPT_TEMPLATES)
     if shape_labels:
         summary = format_shape_summary(shape_labels)
         return template.format(shape_summary=summary)